@@ -16,8 +16,8 @@ def main():
 
     # Speed optimizations for bulk import
     cur.executescript("""
-        PRAGMA journal_mode = OFF;
-        PRAGMA synchronous = OFF;
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
         PRAGMA temp_store = MEMORY;
         PRAGMA cache_size = -200000;
     """)
@@ -30,33 +30,34 @@ def main():
         ) WITHOUT ROWID;
     """)
 
+    # Upsert updates duplicates in place (needs SQLite >= 3.24), whereas
+    # INSERT OR REPLACE deletes and re-inserts the row
     insert_sql = """
-        INSERT OR REPLACE INTO sites (domain, category)
+        INSERT INTO sites (domain, category)
         VALUES (?, ?)
+        ON CONFLICT(domain) DO UPDATE SET category = excluded.category
     """
 
     with csv_path.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=';')
-
-        batch = []
-        batch_size = 10_000
-
-        for row in reader:
-            domain = row["domain"].strip().lower()
-            category = row["llm_category_1"].strip()
-
-            if not domain:
-                continue
-
-            batch.append((domain, category))
-
-            if len(batch) >= batch_size:
-                cur.executemany(insert_sql, batch)
-                conn.commit()
-                batch.clear()
-
-        if batch:
-            cur.executemany(insert_sql, batch)
+        reader = csv.reader(f, delimiter=';')
+
+        # Resolve column positions once instead of building a dict per row.
+        # An empty file just leaves the sites table empty.
+        header = next(reader, None)
+        if header is not None:
+            missing = [c for c in ("domain", "llm_category_1") if c not in header]
+            if missing:
+                conn.close()
+                print(f"Missing column(s) in {csv_path}: {', '.join(missing)}")
+                sys.exit(1)
+            di = header.index("domain")
+            ci = header.index("llm_category_1")
+
+            # Whole import in one transaction: a single commit instead of one per batch
+            conn.execute("BEGIN")
+            # Normalize each domain once, then drop the empty ones
+            rows = ((row[di].strip().lower(), row[ci].strip()) for row in reader if row)
+            cur.executemany(insert_sql, (r for r in rows if r[0]))
             conn.commit()
 
     conn.close()
@@ -10,104 +10,17 @@ Layout:
 """
 
 import socket
-import time
 import threading
-from datetime import datetime, timezone
-from collections import defaultdict
+from datetime import datetime
+from collections import defaultdict, deque
 import tkinter as tk
 from tkinter import scrolledtext
 
-# ─────────────────────────────────────────────────────────────────────────────
-#  FIX helpers
-# ─────────────────────────────────────────────────────────────────────────────
-SOH = "\x01"
-_seq = 0
-
-def next_seq():
-    global _seq; _seq += 1; return _seq
-
-def reset_seq():
-    global _seq; _seq = 0
-
-def fix_now():
-    return datetime.now(timezone.utc).strftime("%Y%m%d-%H:%M:%S")
-
-def make_cl_ord_id(prefix="ORD"):
-    return f"{prefix}-{int(time.time()*1000)}"
-
-def fld(tag, val):
-    return f"{tag}={val}{SOH}"
-
-def checksum(raw):
-    return str(sum(ord(c) for c in raw) % 256).zfill(3)
-
-def _wrap(body):
-    begin = fld(8, "FIX.4.2")
-    blen  = fld(9, len(begin) + len(body))
-    raw   = begin + blen + body
-    raw  += fld(10, checksum(raw))
-    return raw.encode("ascii")
-
-def parse_fix(raw: bytes) -> dict:
-    """Return {tag_int: last_value} for a raw FIX message."""
-    fields = {}
-    for part in raw.decode("ascii", errors="replace").split(SOH):
-        if "=" in part:
-            k, _, v = part.partition("=")
-            try: fields[int(k)] = v
-            except ValueError: pass
-    return fields
-
-def build_nos(sender, target, symbol, side, qty, price, cl_ord_id=None):
-    now = fix_now(); oid = cl_ord_id or make_cl_ord_id("ORD")
-    return _wrap(
-        fld(35,"D")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(11,oid)+fld(21,1)+fld(55,symbol)+fld(54,side)+fld(60,now)
-        +fld(38,int(qty))+fld(40,2)+fld(44,f"{price:.4f}")
-    )
-
-def build_cancel(sender, target, symbol, side, qty, orig_cl_ord_id):
-    now = fix_now(); cancel_id = make_cl_ord_id("CXL")
-    return _wrap(
-        fld(35,"F")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(11,cancel_id)+fld(41,orig_cl_ord_id)+fld(55,symbol)+fld(54,side)
-        +fld(38,int(qty))+fld(60,now)
-    )
-
-def build_md_request(sender, target, symbol, depth=1):
-    rid = f"MDR-{int(time.time()*1000)}"; now = fix_now()
-    return _wrap(
-        fld(35,"V")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(262,rid)+fld(263,1)+fld(264,depth)
-        +fld(267,2)+fld(269,0)+fld(269,1)+fld(146,1)+fld(55,symbol)
-    )
-
-def build_md_snapshot(sender, target, symbol, bid, ask, qty):
-    rid = f"MDR-{int(time.time()*1000)}"; now = fix_now()
-    return _wrap(
-        fld(35,"W")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(262,rid)+fld(55,symbol)+fld(268,2)
-        +fld(269,0)+fld(270,f"{bid:.4f}")+fld(271,int(qty))
-        +fld(269,1)+fld(270,f"{ask:.4f}")+fld(271,int(qty))
-    )
-
-def build_md_incremental(sender, target, symbol, action, entry_type, price, qty):
-    now = fix_now()
-    return _wrap(
-        fld(35,"X")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(268,1)+fld(279,action)+fld(269,entry_type)
-        +fld(55,symbol)+fld(270,f"{price:.4f}")+fld(271,int(qty))
-    )
-
-def build_md_reject(sender, target, req_id, reason_code=0, reason_text=""):
-    now = fix_now()
-    body = (fld(35,"Y")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-            +fld(262,req_id)+fld(281,reason_code))
-    if reason_text: body += fld(58, reason_text)
-    return _wrap(body)
-
-def pretty(raw: bytes) -> str:
-    return raw.decode("ascii", errors="replace").replace(SOH, " │ ")
+from fix_codec import (
+    SOH, make_cl_ord_id, parse_fix, pretty, reset_seq,
+    build_nos, build_cancel, build_md_request, build_md_snapshot,
+    build_md_incremental, build_md_reject,
+)
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Order book model
@@ -130,6 +43,8 @@ class OrderBook:
         self._lock  = threading.Lock()
 
     def _safe_float(self, v, default=0.0):
+        # Absent tags are the common case: skip the raise/catch for them
+        if not v: return default
         try: return float(v)
         except: return default
 
@@ -576,10 +491,13 @@ class FIXTerminal(tk.Tk):
         self._md_btns     = []
         self._book        = OrderBook()
         self._last_order  = None
+        self._refresh_pending = False
+        self._log_queue       = deque()
+        self._flush_scheduled = False
 
         self._build()
         self.protocol("WM_DELETE_WINDOW", self._on_close)
-        # Refresh order book display every 200ms
+        # Draw the empty book; later redraws only happen when the book changes
         self._refresh_book()
 
     # ── layout ───────────────────────────────────────────────────────────────
@@ -717,11 +635,17 @@ class FIXTerminal(tk.Tk):
         self._log_box.tag_config("info", foreground=BLUE)
         self._log_box.tag_config("body", foreground="#9e9e9e")
 
-    # ── order book refresh loop ───────────────────────────────────────────────
+    # ── order book refresh ───────────────────────────────────────────────────
+    def _schedule_refresh(self):
+        # Coalesce bursts of updates into one redraw; nothing runs while idle
+        if self._refresh_pending: return
+        self._refresh_pending = True
+        self.after(50, self._refresh_book)
+
     def _refresh_book(self):
+        self._refresh_pending = False
         bids, asks, trades, last, sym = self._book.snapshot()
         self._ob_widget.refresh(bids, asks, trades, last, sym)
-        self.after(200, self._refresh_book)
 
     # ── connection ───────────────────────────────────────────────────────────
     def _toggle_connection(self):
@@ -739,6 +663,8 @@ class FIXTerminal(tk.Tk):
         try:
             sock = socket.create_connection((host, port), timeout=8)
             sock.settimeout(None)
+            # Orders are small and latency-sensitive: don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._sock = sock
             self._reader_stop.clear()
             threading.Thread(target=self._reader_loop, daemon=True).start()
@@ -838,6 +764,7 @@ class FIXTerminal(tk.Tk):
             self._book.apply_md_snapshot(raw)
         else:
             self._book.apply(fields)
+        self._schedule_refresh()
 
         # Pick label colour
         tag = "feed"
@@ -975,20 +902,31 @@ class FIXTerminal(tk.Tk):
     # ── log ──────────────────────────────────────────────────────────────────
     def _log(self, label, body, tag="body"):
         ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        self._log_queue.append((f"[{ts}] ", "ts", f"{label}\n", tag, f"{body}\n\n", "body"))
+        # Bursts are written to the widget in one go every 50ms
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(50, self._flush_log)
+
+    def _flush_log(self):
+        self._flush_scheduled = False
+        if not self._log_queue: return
+        chunks = []
+        while self._log_queue: chunks.extend(self._log_queue.popleft())
         self._log_box.config(state=tk.NORMAL)
-        self._log_box.insert(tk.END, f"[{ts}] ", "ts")
-        self._log_box.insert(tk.END, f"{label}\n", tag)
-        self._log_box.insert(tk.END, f"{body}\n\n", "body")
+        self._log_box.insert(tk.END, *chunks)
         self._log_box.see(tk.END)
         self._log_box.config(state=tk.DISABLED)
 
     def _clear_log(self):
+        self._log_queue.clear()
         self._log_box.config(state=tk.NORMAL)
         self._log_box.delete("1.0", tk.END)
         self._log_box.config(state=tk.DISABLED)
 
     def _clear_book(self):
         self._book = OrderBook()
+        self._refresh_book()
         self._log("INFO", "Order book cleared.", "info")
 
     def _reset_seq(self):
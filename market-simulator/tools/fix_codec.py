@@ -0,0 +1,130 @@
+"""
+FIX 4.2 message codec shared by the tkinter terminal (client.py) and the
+web terminal (fix_web_terminal.py).
+No third-party packages required.
+"""
+
+import functools
+import itertools
+import time
+
+SOH = "\x01"
+SOH_B = b"\x01"
+
+# Constant fields, preformatted once as bytes
+_BEGIN         = b"8=FIX.4.2\x01"
+_MSGTYPE_D     = b"35=D\x01"
+_HANDL         = b"21=1\x01"
+_ORDTYPE_LIMIT = b"40=2\x01"
+_BEGIN_SUM     = sum(_BEGIN)   # BeginString's share of the checksum
+
+# count.__next__ is a single C call, atomic under the GIL
+_seq = itertools.count(1)
+next_seq = _seq.__next__
+
+def reset_seq():
+    # Two separate rebinds: a sender racing a reset may still draw one
+    # number from the old counter
+    global _seq, next_seq
+    _seq = itertools.count(1); next_seq = _seq.__next__
+
+def fix_now():
+    # UTC SendingTime straight from time.gmtime(), no datetime object needed
+    return "%04d%02d%02d-%02d:%02d:%02d" % time.gmtime()[:6]
+
+def make_cl_ord_id(prefix="ORD"):
+    return f"{prefix}-{int(time.time()*1000)}"
+
+def _wrap(body: bytes) -> bytes:
+    # Checksum summed per part (BeginString's share is precomputed) so the
+    # whole message, trailer included, is built with a single join
+    blen = b"9=%d\x01" % (len(_BEGIN) + len(body))
+    cks  = (_BEGIN_SUM + sum(blen) + sum(body)) % 256
+    return b"".join((_BEGIN, blen, body, b"10=%03d\x01" % cks))
+
+def parse_fix(raw: bytes) -> dict:
+    """Return {tag_int: last_value} for a raw FIX message."""
+    fields = {}
+    for part in raw.decode("ascii", errors="replace").split(SOH):
+        if "=" in part:
+            k, _, v = part.partition("=")
+            try: fields[int(k)] = v
+            except ValueError: pass
+    return fields
+
+@functools.lru_cache(maxsize=32)
+def make_nos_builder(sender, target, symbol, side):
+    """
+    Return build(qty, price, cl_ord_id=None) -> bytes, a NewOrderSingle (D)
+    encoder specialised for one sender/target/symbol/side. Everything that
+    does not change between orders is encoded once, here.
+    """
+    prefix = b"".join((_MSGTYPE_D,
+                       b"49=", sender.encode("ascii"), SOH_B,
+                       b"56=", target.encode("ascii"), SOH_B))
+    sym_side = b"".join((_HANDL,
+                         b"55=", symbol.encode("ascii"), SOH_B,
+                         b"54=", str(side).encode("ascii"), SOH_B))
+
+    def build(qty, price, cl_ord_id=None):
+        now = fix_now().encode("ascii"); oid = cl_ord_id or make_cl_ord_id("ORD")
+        return _wrap(b"".join((
+            prefix,
+            b"34=%d\x0152=" % next_seq(), now, SOH_B,
+            b"11=", oid.encode("ascii"), SOH_B,
+            sym_side,
+            b"60=", now, SOH_B,
+            b"38=%d\x01" % int(qty),
+            _ORDTYPE_LIMIT,
+            b"44=%.4f\x01" % price,
+        )))
+    return build
+
+def build_nos(sender, target, symbol, side, qty, price, cl_ord_id=None):
+    return make_nos_builder(sender, target, symbol, side)(qty, price, cl_ord_id)
+
+def build_cancel(sender, target, symbol, side, qty, orig_cl_ord_id):
+    now = fix_now(); cancel_id = make_cl_ord_id("CXL")
+    return _wrap((
+        f"35=F\x0149={sender}\x0156={target}\x0134={next_seq()}\x0152={now}\x01"
+        f"11={cancel_id}\x0141={orig_cl_ord_id}\x0155={symbol}\x0154={side}\x01"
+        f"38={int(qty)}\x0160={now}\x01"
+    ).encode("ascii"))
+
+def build_md_request(sender, target, symbol, depth=1):
+    rid = f"MDR-{int(time.time()*1000)}"; now = fix_now()
+    return _wrap((
+        f"35=V\x0149={sender}\x0156={target}\x0134={next_seq()}\x0152={now}\x01"
+        f"262={rid}\x01263=1\x01264={depth}\x01"
+        f"267=2\x01269=0\x01269=1\x01146=1\x0155={symbol}\x01"
+    ).encode("ascii"))
+
+def build_md_snapshot(sender, target, symbol, bid, ask, qty):
+    rid = f"MDR-{int(time.time()*1000)}"; now = fix_now()
+    return _wrap((
+        f"35=W\x0149={sender}\x0156={target}\x0134={next_seq()}\x0152={now}\x01"
+        f"262={rid}\x0155={symbol}\x01268=2\x01"
+        f"269=0\x01270={bid:.4f}\x01271={int(qty)}\x01"
+        f"269=1\x01270={ask:.4f}\x01271={int(qty)}\x01"
+    ).encode("ascii"))
+
+def build_md_incremental(sender, target, symbol, action, entry_type, price, qty):
+    now = fix_now()
+    return _wrap((
+        f"35=X\x0149={sender}\x0156={target}\x0134={next_seq()}\x0152={now}\x01"
+        f"268=1\x01279={action}\x01269={entry_type}\x01"
+        f"55={symbol}\x01270={price:.4f}\x01271={int(qty)}\x01"
+    ).encode("ascii"))
+
+def build_md_reject(sender, target, req_id, reason_code=0, reason_text=""):
+    now = fix_now()
+    body = (f"35=Y\x0149={sender}\x0156={target}\x0134={next_seq()}\x0152={now}\x01"
+            f"262={req_id}\x01281={reason_code}\x01")
+    if reason_text: body += f"58={reason_text}\x01"
+    return _wrap(body.encode("ascii"))
+
+def pretty(raw: bytes) -> str:
+    # The separator is not ASCII, so replacing on bytes forces a UTF-8 decode;
+    # an ASCII decode followed by str.replace is cheaper (str.translate is
+    # far slower still for a single-char -> multi-char mapping)
+    return raw.decode("ascii", errors="replace").replace(SOH, " │ ")
@@ -22,98 +22,16 @@ import secrets
 import socket
 import ssl
 import threading
-import time
 import queue
-from datetime import datetime, timezone
+from datetime import datetime
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse
 
-# ─────────────────────────────────────────────────────────────────────────────
-#  FIX helpers  (identical to the tkinter version)
-# ─────────────────────────────────────────────────────────────────────────────
-SOH  = "\x01"
-_seq = 0
-_seq_lock = threading.Lock()
-
-def next_seq():
-    global _seq
-    with _seq_lock:
-        _seq += 1
-        return _seq
-
-def reset_seq():
-    global _seq
-    with _seq_lock:
-        _seq = 0
-
-def fix_now():
-    return datetime.now(timezone.utc).strftime("%Y%m%d-%H:%M:%S")
-
-def fld(tag, val):
-    return f"{tag}={val}{SOH}"
-
-def checksum(raw):
-    return str(sum(ord(c) for c in raw) % 256).zfill(3)
-
-def _wrap(body):
-    begin = fld(8, "FIX.4.2")
-    blen  = fld(9, len(begin) + len(body))
-    raw   = begin + blen + body
-    raw  += fld(10, checksum(raw))
-    return raw.encode("ascii")
-
-def parse_fix(raw: bytes) -> dict:
-    fields = {}
-    for part in raw.decode("ascii", errors="replace").split(SOH):
-        if "=" in part:
-            k, _, v = part.partition("=")
-            try: fields[int(k)] = v
-            except ValueError: pass
-    return fields
-
-def pretty(raw: bytes) -> str:
-    return raw.decode("ascii", errors="replace").replace(SOH, " │ ")
-
-def build_nos(sender, target, symbol, side, qty, price):
-    now = fix_now(); oid = f"ORD-{int(time.time()*1000)}"
-    return _wrap(
-        fld(35,"D")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(11,oid)+fld(21,1)+fld(55,symbol)+fld(54,side)+fld(60,now)
-        +fld(38,int(qty))+fld(40,2)+fld(44,f"{price:.4f}")
-    )
-
-def build_md_request(sender, target, symbol, depth=1):
-    rid = f"MDR-{int(time.time()*1000)}"; now = fix_now()
-    return _wrap(
-        fld(35,"V")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(262,rid)+fld(263,1)+fld(264,depth)
-        +fld(267,2)+fld(269,0)+fld(269,1)+fld(146,1)+fld(55,symbol)
-    )
-
-def build_md_snapshot(sender, target, symbol, bid, ask, qty):
-    rid = f"MDR-{int(time.time()*1000)}"; now = fix_now()
-    return _wrap(
-        fld(35,"W")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(262,rid)+fld(55,symbol)+fld(268,2)
-        +fld(269,0)+fld(270,f"{bid:.4f}")+fld(271,int(qty))
-        +fld(269,1)+fld(270,f"{ask:.4f}")+fld(271,int(qty))
-    )
-
-def build_md_incremental(sender, target, symbol, action, entry_type, price, qty):
-    now = fix_now()
-    return _wrap(
-        fld(35,"X")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-        +fld(268,1)+fld(279,action)+fld(269,entry_type)
-        +fld(55,symbol)+fld(270,f"{price:.4f}")+fld(271,int(qty))
-    )
-
-def build_md_reject(sender, target, req_id, reason_code=0, reason_text=""):
-    now = fix_now()
-    body = (fld(35,"Y")+fld(49,sender)+fld(56,target)+fld(34,next_seq())+fld(52,now)
-            +fld(262,req_id)+fld(281,reason_code))
-    if reason_text: body += fld(58, reason_text)
-    return _wrap(body)
-
+from fix_codec import (
+    SOH, parse_fix, pretty, reset_seq,
+    build_nos, build_md_request, build_md_snapshot,
+    build_md_incremental, build_md_reject,
+)
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Order book model
@@ -136,6 +54,8 @@ class OrderBook:
             self.pending_orders[clord_id] = {"price": price, "qty": qty, "side": side}
 
     def _sf(self, v):
+        # Absent tags are the common case: skip the raise/catch for them
+        if not v: return 0.0
         try: return float(v)
         except: return 0.0
 
@@ -288,6 +208,8 @@ class FIXConnection:
         try:
             sock = socket.create_connection((host, port), timeout=8)
             sock.settimeout(None)
+            # Orders are small and latency-sensitive: don't let Nagle hold them back
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             with self._lock:
                 self._sock = sock
                 self._stop.clear()